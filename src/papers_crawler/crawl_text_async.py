@@ -12,20 +12,34 @@ import time
 import logging
 import csv
 import zipfile
+import zlib
 import asyncio
 import re
 import json
+import random
+import shutil
+import subprocess
+import tarfile
 import traceback
+import weakref
 from collections import deque
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 from datetime import datetime
 
-from bs4 import BeautifulSoup, Tag, NavigableString
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag, NavigableString
 from playwright.async_api import async_playwright, Page
 
 from playwright_stealth import Stealth
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 # Import CLIProgressTracker from crawler_async
 try:
     from .crawler_async import CLIProgressTracker
@@ -35,6 +49,279 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Number of browser contexts used to extract articles concurrently
+CONTEXT_POOL_SIZE = 4
+# Number of journals crawled at the same time (each with its own listing context)
+JOURNAL_CONCURRENCY = 3
+# Pooled contexts are replaced after this many articles to bound Firefox memory growth
+_CONTEXT_RECYCLE_PAGES = 50
+# Seconds between the starts of two article navigations, across all workers
+_REQUEST_INTERVAL = (0.2, 0.5)
+
+# Listing pages are only read for their article citations, so only those subtrees
+# are built. Issue pages also keep the headers the issue date can be read from.
+_ISSUE_LINK_RE = re.compile(r"/issue\?pii=")
+_YEAR_RE = re.compile(r"\d{4}")
+_VOLUME_YEAR_RE = re.compile(r"\((\d{4})\)")
+_ISSUE_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+# Cookie-consent buttons as (CSS selector, lowercase label substring or None),
+# tried in order; label matching mirrors Playwright's case-insensitive :has-text
+_COOKIE_RULES = (
+    ('#onetrust-accept-btn-handler', None),
+    ('.optanon-alert-box-button-middle', None),
+    ('button', 'accept'),
+    ('button', 'i agree'),
+    ('button', 'agree'),
+    ('button', 'ok'),
+    ('button[id*="accept"]', None),
+    ('button[class*="accept"]', None),
+    ('a', 'accept'),
+)
+
+# OneTrust stores the dismissed banner in this cookie; presetting it on each
+# context keeps the banner from being shown in the first place
+_CONSENT_COOKIES = [
+    {'name': 'OptanonAlertBoxClosed', 'value': '2025-01-01T00:00:00.000Z', 'domain': '.cell.com', 'path': '/'},
+]
+
+# Clicks the first visible consent button in one in-page pass. Returns the
+# 1-based index of the rule that matched, or 0 if no button is shown yet.
+_COOKIE_PROBE_JS = """
+(rules) => {
+    for (let i = 0; i < rules.length; i++) {
+        const [selector, label] = rules[i];
+        for (const el of document.querySelectorAll(selector)) {
+            if (el.getClientRects().length === 0) continue;
+            if (label !== null && !el.textContent.toLowerCase().includes(label)) continue;
+            el.click();
+            return i + 1;
+        }
+    }
+    return 0;
+}
+"""
+
+# Serialises only the outermost elements matching `selector`, so listing pages
+# send just the parts we parse over the Playwright protocol
+_LISTING_HTML_JS = """
+(selector) => Array.from(document.querySelectorAll(selector))
+    .filter(el => !(el.parentElement && el.parentElement.closest(selector)))
+    .map(el => el.outerHTML)
+    .join('')
+"""
+_CITATION_SELECTOR = ".articleCitation"
+_ISSUE_PAGE_SELECTOR = ".articleCitation, .issue-item__title, .volume-issue, .issue-item__detail, .u-cloak-me"
+# Issues index: issue links, the <li> blocks holding their dates and the Open
+# Archive marker, kept in document order for the find_previous lookup
+_ISSUE_LIST_SELECTOR = 'li, a[href*="/issue?pii="], div.list-of-issues__open-archive'
+
+_CITATION_STRAINER = SoupStrainer(class_="articleCitation")
+_ISSUE_PAGE_STRAINER = SoupStrainer(class_=[
+    "articleCitation",
+    "issue-item__title",
+    "volume-issue",
+    "issue-item__detail",
+    "u-cloak-me",
+])
+# Full-text pages: only citation <meta> tags and the <article> subtree are read,
+# so site navigation, recommendation widgets and the footer never become Tags
+_FULLTEXT_STRAINER = SoupStrainer(["meta", "article"])
+
+# CSS selectors run on every page are compiled once instead of per call
+# Page chrome ("show more/less", toggles, menus, metrics widgets) matched by a
+# case-insensitive class substring, removed from full-text pages in one pass
+_UI_CLASSES = ('show-more', 'show-less', 'expand', 'collapse', 'toggle', 'button',
+               'nav', 'menu', 'footer', 'sidebar', 'advertisement',
+               'social-share', 'download-link', 'metrics', 'altmetric')
+_UI_CLASS_SELECTOR = sv.compile(", ".join(f'[class*="{ui_class}" i]' for ui_class in _UI_CLASSES))
+_FULLTEXT_LINK_SELECTOR = sv.compile('a[href*="/fulltext/"]')
+_ARTICLE_CITATION_SELECTOR = sv.compile(_CITATION_SELECTOR)
+_OA_LABEL_SELECTOR = sv.compile(".OALabel")
+_ARTICLE_TITLE_SELECTOR = sv.compile(".toc__item__title")
+_ARTICLE_DATE_SELECTOR = sv.compile(".toc__item__date")
+# Footnote/reference anchors in priority order: when two anchors share an id,
+# the entry found by the earlier selector wins
+_FOOTNOTE_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'a[id^="bib"]',
+    'a[id^="ref"]',
+    'a[name^="bib"]',
+    'a[name^="ref"]',
+    '[id^="bib"]',
+    '[id^="ref"]',
+    'li.reference',
+    'li.bibliography__item',
+))
+_FOOTNOTE_ANY_SELECTOR = sv.compile(", ".join(selector.pattern for selector in _FOOTNOTE_SELECTORS))
+_AUTHOR_NAME_SELECTOR = sv.compile('a[rel="author"], span[data-test="author-name"], span.author-name, span[itemprop="name"], a[itemprop="name"]')
+_ARTICLE_HTML_JS = """
+() => {
+    const article = document.querySelector('article');
+    if (!article || !article.querySelector('div[data-core-wrapper="header"], div[data-core-wrapper="content"]')) return null;
+    const metas = Array.from(document.querySelectorAll('meta:not(article meta)'), m => m.outerHTML).join('');
+    return `<html><head>${metas}</head><body>${article.outerHTML}</body></html>`;
+}
+"""
+
+# Fallback extraction (pages without the article wrappers): headings plus
+# paragraphs that are not part of a figure caption, in document order
+# Abstract paragraphs are <p> or <div role="paragraph">; only leaf blocks are
+# taken so a wrapper div doesn't repeat the text of the paragraphs inside it
+_FALLBACK_ABSTRACT_SELECTOR = sv.compile("p, div:not(:has(p, div))")
+_FALLBACK_INTRO_SELECTOR = sv.compile("h2, h3, h4, p:not(figure p)")
+_FALLBACK_BODY_SELECTOR = sv.compile("h2, h3, h4, h5, h6, p:not(figure p)")
+
+# Figure viewer control labels that end up in caption text
+_CAPTION_NOISE = frozenset({"Hide caption", "Figure viewer", "Show caption", "Collapse", "Expand"})
+_CAPTION_NOISE_RE = re.compile("|".join(map(re.escape, sorted(_CAPTION_NOISE))))
+
+# Tag names and class fragments append_content tests for every node it visits
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_SKIP_NAMES = frozenset({"script", "style", "svg", "noscript", "form", "hr", "iframe"})
+_CONTAINER_KEYWORDS = (
+    "core-container",
+    "section",
+    "subsection",
+    "article__section",
+    "article-section",
+    "body-section",
+    "content-block",
+)
+
+
+# Whitespace and punctuation patterns applied to every text fragment of an article
+_WS_RE = re.compile(r"\s+")
+_SPACES_RE = re.compile(r" +")
+_CELL_PIPE_RE = re.compile(r"\s*\|\s*")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([.,;:!?])")
+_MISSING_SPACE_AFTER_PUNCT_RE = re.compile(r"([.,;:!?])([A-Za-z])")
+
+
+# Fragments up to this length go through the memoized cleaner; author names,
+# labels and reference snippets repeat a lot, long paragraphs rarely do
+_CLEAN_TEXT_CACHE_MAX_LEN = 256
+
+
+@lru_cache(maxsize=4096)
+def _clean_short_text(value: str) -> str:
+    return _WS_RE.sub(" ", value).strip()
+
+
+def _clean_text(value: str) -> str:
+    """Normalize whitespace, preserving inline superscripts."""
+    if not value:
+        return ""
+    if len(value) <= _CLEAN_TEXT_CACHE_MAX_LEN:
+        return _clean_short_text(value)
+    return _WS_RE.sub(" ", value).strip()
+
+
+# Resource types article pages never need: extraction only reads the HTML DOM
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Third-party analytics, ad and consent-manager hosts; none of them affect the
+# page content (the consent banner is pre-dismissed with _CONSENT_COOKIES)
+_THIRD_PARTY_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "cookielaw.org",
+    "onetrust.com",
+    "hotjar.com",
+    "facebook.net",
+    "scorecardresearch.com",
+    "crazyegg.com",
+)
+_THIRD_PARTY_URL_RE = re.compile(
+    r"^https?://(?:[^/?#]*\.)?(?:"
+    + "|".join(re.escape(host) for host in _THIRD_PARTY_HOSTS)
+    + r")(?::\d+)?(?:[/?#]|$)"
+)
+
+
+async def _block_heavy_resources(route) -> None:
+    """Playwright route handler that aborts requests for heavy, unused resources."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _THIRD_PARTY_URL_RE.match(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Listing and archive pages are clicked and checked for visibility, so they keep
+# their stylesheets; images, media and fonts are still never looked at
+_LISTING_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+async def _block_listing_resources(route) -> None:
+    """Playwright route handler for listing pages: aborts images, media, fonts and trackers."""
+    request = route.request
+    if request.resource_type in _LISTING_BLOCKED_RESOURCE_TYPES or _THIRD_PARTY_URL_RE.match(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Browser fingerprint shared by every context the text crawler opens
+_CONTEXT_OPTIONS = {
+    'accept_downloads': False,  # Not downloading files
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:143.0) Gecko/20100101 Firefox/143.0',
+    'viewport': {'width': 1920, 'height': 1080},
+    'locale': 'en-US',
+    'timezone_id': 'America/New_York',
+    'permissions': ['geolocation'],
+    'geolocation': {'longitude': -74.0060, 'latitude': 40.7128},
+    'color_scheme': 'light',
+    'extra_http_headers': {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    },
+}
+
+_STEALTH_INIT_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+"""
+
+
+# Anything that is not a letter, digit, space, '-' or '_' (Unicode-aware, like str.isalnum)
+_UNSAFE_TITLE_RE = re.compile(r"[^\w\- ]")
+
+
+def _safe_title(title: str) -> str:
+    """Turn an article title into a filesystem-safe file stem (max 100 chars)."""
+    return _UNSAFE_TITLE_RE.sub("", title).strip()[:100]
+
+
+def _find_fulltext_href(art: Tag) -> Optional[str]:
+    """Return the href of an article citation's Full-Text HTML link, if any."""
+    link = _FULLTEXT_LINK_SELECTOR.select_one(art)
+    if link is not None:
+        return link["href"]
+    # Rare: the link is only recognisable by its label
+    for link in art.find_all("a", href=True):
+        if "Full-Text HTML" in link.get_text():
+            return link["href"]
+    return None
+
+
+async def _goto_listing(page: Page, url: str, selector: str, timeout: int = 10000) -> None:
+    """Navigate to a listing page and return once `selector` is in the DOM.
+    
+    If the selector does not show up within `timeout` ms the page is parsed
+    as-is; callers already handle pages without the expected elements.
+    """
+    await page.goto(url, timeout=30000, wait_until="domcontentloaded")
+    try:
+        await page.wait_for_selector(selector, timeout=timeout, state="attached")
+    except Exception:
+        logger.debug(f"Selector {selector!r} not found on {url}, continuing")
+
 
 async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Dict]:
     """Navigate to full-text HTML page and extract all text content as JSON.
@@ -58,22 +345,70 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
     """
     try:
         logger.info(f"📖 Navigating to full-text page: {fulltext_url}")
-        await page.goto(fulltext_url, timeout=30000)
-        await page.wait_for_timeout(2000)
+        await page.goto(fulltext_url, timeout=30000, wait_until="domcontentloaded")
+
+        # Wait for the article DOM instead of sleeping a fixed amount of time. Only
+        # presence matters (the HTML is read, not rendered), so don't wait for visibility.
+        # If the selector never shows up, the fallback extraction below handles it.
+        try:
+            await page.wait_for_selector(
+                "article, section#bodymatter, section#references", timeout=10000, state="attached"
+            )
+        except Exception:
+            logger.debug("Article selector not found, waiting for network idle instead")
+            try:
+                await page.wait_for_load_state("networkidle", timeout=5000)
+            except Exception:
+                pass
+
+        # Only the <meta> tags and the <article> cross the Playwright protocol; the
+        # whole document is fetched when there is no <article> or it has no content
+        # wrappers (the fallback extraction also reads sections outside <article>)
+        html = await page.evaluate(_ARTICLE_HTML_JS)
+        if html is None:
+            html = await page.content()
+    except Exception as e:
+        logger.error(f"❌ Failed to load full-text page: {e}")
+        logger.debug(traceback.format_exc())
+        return None
+    
+    # Parsing is pure CPU work: run it in a worker thread so the event loop keeps
+    # driving the other pooled pages while this article is parsed
+    return await asyncio.to_thread(parse_fulltext_html, html)
+
+
+def parse_fulltext_html(html: str) -> Optional[Dict]:
+    """Extract the sections of a full-text article page as JSON.
+    
+    Args:
+        html: HTML of the full-text page (or just its <meta> tags and <article>)
+        
+    Returns:
+        Dict: JSON structure with sections as keys and content as values, or None if extraction fails
+    """
+    try:
+        soup = BeautifulSoup(html, "lxml", parse_only=_FULLTEXT_STRAINER)
         
-        html = await page.content()
-        soup = BeautifulSoup(html, "html.parser")
+        # Find the main article element; cleanup only needs to touch what we extract
+        article = soup.find("article")
+        if article is not None and article.find("div", attrs={"data-core-wrapper": ["header", "content"]}) is not None:
+            cleanup_root = article
+        else:
+            # No <article> or no content wrappers: the fallback extraction and the
+            # references lookup below read sections anywhere on the page
+            soup = BeautifulSoup(html, "lxml")
+            article = soup.find("article")
+            cleanup_root = soup
         
-        # Remove UI elements, buttons, and navigation that are not article content
-        for unwanted in soup.find_all(['button', 'nav', 'script', 'style', 'iframe', 'aside']):
+        # Remove scripts, styles, UI elements, buttons, and navigation that are not
+        # article content; extract_text_with_refs would otherwise pick up their text
+        for unwanted in cleanup_root.find_all(['script', 'style', 'noscript', 'button', 'nav', 'iframe', 'aside']):
             unwanted.decompose()
         
         # Remove specific UI classes that contain "show more/less" and other UI elements
-        ui_classes = ['show-more', 'show-less', 'expand', 'collapse', 'toggle', 'button', 
-                      'nav', 'menu', 'footer', 'sidebar', 'advertisement',
-                      'social-share', 'download-link', 'metrics', 'altmetric']
-        for ui_class in ui_classes:
-            for elem in soup.find_all(class_=lambda x: x and ui_class in x.lower()):
+        for elem in _UI_CLASS_SELECTOR.select(cleanup_root):
+            # Skip matches inside an element that was already removed
+            if not elem.decomposed:
                 elem.decompose()
         
         # JSON structure to store sections
@@ -85,25 +420,14 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
         text_parts = []  # Keep for compatibility with existing functions
         recent_lines = deque(maxlen=60)
 
-        references_section = soup.find("section", id="references")
+        references_section = cleanup_root.find("section", id="references")
         footnote_map: Dict[str, str] = {}
         footnote_in_refs: Dict[str, bool] = {}
         footnote_elements: Set[Tag] = set()
         pending_bullet_prefix: Optional[str] = None
 
-        heading_tags = ("h1", "h2", "h3", "h4", "h5", "h6")
-        skip_names = {"script", "style", "svg", "noscript", "form", "hr", "iframe"}
         indent_step = 2
         max_indent = 12
-        container_keywords = (
-            "core-container",
-            "section",
-            "subsection",
-            "article__section",
-            "article-section",
-            "body-section",
-            "content-block"
-        )
         unwanted_phrases = [
             "search for articles by this author",
             "crossref",
@@ -135,7 +459,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
         def clean_reference_entry(tag: Tag) -> str:
             fragments: List[str] = []
             for string in tag.stripped_strings:
-                fragment = clean_text(str(string))
+                fragment = _clean_text(str(string))
                 if not fragment:
                     continue
                 lower_fragment = fragment.lower()
@@ -145,7 +469,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
             if not fragments:
                 return ""
             combined = " ".join(fragments)
-            combined = re.sub(r"\s+", " ", combined).strip()
+            combined = _WS_RE.sub(" ", combined).strip()
             combined = re.sub(r"^\d+(\.|:)?\s*", "", combined)
             combined = combined.replace(" ,", ",")
             return combined
@@ -168,7 +492,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
             normalized = str(value).strip().lower()
             if normalized.startswith("#"):
                 normalized = normalized[1:]
-            normalized = re.sub(r"\s+", "", normalized)
+            normalized = _WS_RE.sub("", normalized)
             return normalized
 
         def split_identifier_values(raw_value) -> List[str]:
@@ -220,19 +544,12 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
             return identifiers
 
         def build_footnote_map() -> None:
-            selectors = [
-                'a[id^="bib"]',
-                'a[id^="ref"]',
-                'a[name^="bib"]',
-                'a[name^="ref"]',
-                '[id^="bib"]',
-                '[id^="ref"]',
-                'li.reference',
-                'li.bibliography__item',
-            ]
+            # One walk over the page collects every anchor; the per-selector passes
+            # below only filter that (short) list to keep the priority order
+            anchors = _FOOTNOTE_ANY_SELECTOR.select(soup)
             seen_ids: Set[str] = set()
-            for selector in selectors:
-                for candidate in soup.select(selector):
+            for selector in _FOOTNOTE_SELECTORS:
+                for candidate in selector.filter(anchors):
                     fid = candidate.get("id") or candidate.get("name")
                     if not fid:
                         anchor = candidate.find("a", id=True) or candidate.find("a", attrs={"name": True})
@@ -419,13 +736,6 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
             flush_refs()
             return parts
 
-        def clean_text(value: str) -> str:
-            if not value:
-                return ""
-            # Preserve inline superscripts but normalize whitespace
-            text = re.sub(r"\s+", " ", value).strip()
-            return text
-
         def should_skip_text(text: str) -> bool:
             if not text:
                 return True
@@ -453,7 +763,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
 
         def append_line(text: str, indent: int = 0, allow_repeat: bool = False) -> None:
             nonlocal pending_bullet_prefix, current_section_parts
-            cleaned = clean_text(text)
+            cleaned = _clean_text(text)
             if not cleaned:
                 return
             stripped = cleaned.strip()
@@ -463,7 +773,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
             if stripped in {"+", "-", "−"} and text_parts:
                 updated = text_parts[-1].rstrip("\n") + f" {stripped}\n"
                 text_parts[-1] = updated
-                recent_lines.append(clean_text(updated.strip()))
+                recent_lines.append(_clean_text(updated.strip()))
                 return
             if should_skip_text(cleaned):
                 return
@@ -472,7 +782,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
             if pending_bullet_prefix:
                 cleaned = pending_bullet_prefix + cleaned
                 pending_bullet_prefix = None
-            dedup_key = clean_text(cleaned)
+            dedup_key = _clean_text(cleaned)
             if not allow_repeat and dedup_key in recent_lines:
                 return
             recent_lines.append(dedup_key)
@@ -483,7 +793,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
 
         def append_heading(level: int, text: str) -> None:
             nonlocal current_section, current_section_parts, section_stack
-            heading_text = clean_text(text)
+            heading_text = _clean_text(text)
             if should_skip_text(heading_text):
                 return
             level = max(1, min(level, 6))
@@ -518,7 +828,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
                 # Collect all text including superscripts inline using extract_text_with_refs
                 text_parts = extract_text_with_refs(item)
                 full_text = "".join(text_parts).strip()
-                full_text = re.sub(r' +', ' ', full_text)
+                full_text = _SPACES_RE.sub(" ", full_text)
                 
                 # Remove nested list text temporarily
                 nested_lists = item.find_all(["ul", "ol"], recursive=False)
@@ -527,7 +837,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
                     nested_text = "".join(nested_parts).strip()
                     full_text = full_text.replace(nested_text, "")
                 
-                full_text = clean_text(full_text)
+                full_text = _clean_text(full_text)
                 
                 if full_text:
                     append_line(f"{bullet}{full_text}", indent=indent, allow_repeat=True)
@@ -542,7 +852,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
 
         def append_table(table_tag: Tag, indent: int) -> None:
             nonlocal current_section_parts
-            rows = []
+            lines = []
             for tr in table_tag.find_all("tr"):
                 cells = []
                 for cell in tr.find_all(["th", "td"]):
@@ -550,35 +860,25 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
                     cell_parts = extract_text_with_refs(cell)
                     cell_text = "".join(cell_parts).strip()
                     # Normalize whitespace and clean up the text
-                    cell_text = re.sub(r'\s+', ' ', cell_text)
-                    cell_text = re.sub(r'\s*\|\s*', ' ', cell_text)  # Remove any pipe characters from cell content
+                    cell_text = _WS_RE.sub(" ", cell_text)
+                    cell_text = _CELL_PIPE_RE.sub(" ", cell_text)  # Remove any pipe characters from cell content
                     cells.append(cell_text)
-                if any(cell for cell in cells):
-                    rows.append(cells)
+                # Join cells with pipe separator (empty cells keep the columns aligned)
+                line = " | ".join(cells)
+                if line.strip(" |"):
+                    lines.append(line + "\n")
 
-            if not rows:
+            if not lines:
                 return
 
-            # Add table marker to both text_parts and current_section_parts
-            text_parts.append("\n")
-            text_parts.append("[Table]\n")
-            current_section_parts.append("\n")
-            current_section_parts.append("[Table]\n")
-            
-            # Output each row on its own line
-            for row in rows:
-                # Join cells with pipe separator
-                line = " | ".join(row)
-                if line.strip():
-                    text_parts.append(line + "\n")
-                    current_section_parts.append(line + "\n")
-            
-            text_parts.append("\n")
-            current_section_parts.append("\n")
+            # Add table marker and one line per row to both text_parts and current_section_parts
+            table_block = ["\n", "[Table]\n", *lines, "\n"]
+            text_parts.extend(table_block)
+            current_section_parts.extend(table_block)
 
         def append_content(node, indent: int = 0) -> None:
             if isinstance(node, NavigableString):
-                text = clean_text(str(node))
+                text = _clean_text(str(node))
                 append_line(text, indent=indent)
                 return
 
@@ -590,7 +890,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
             if node in footnote_elements:
                 return
 
-            if name in skip_names:
+            if name in _SKIP_NAMES:
                 return
 
             if node.get("aria-hidden") == "true":
@@ -608,26 +908,28 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
                     append_table(table, indent)
                 return
 
-            classes = [cls.lower() for cls in node.get("class", [])]
+            # One lowercase string for all class checks; most tags have no class at all
+            class_attr = node.attrs.get("class")
+            class_str = " ".join(class_attr).lower() if class_attr else ""
             
             # Handle div.figure-wrap which may contain tables
-            if any("figure-wrap" in cls for cls in classes):
+            if "figure-wrap" in class_str:
                 table = node.find("table", recursive=True)
                 if table:
                     append_table(table, indent)
                 return
             
-            if any("figure" in cls for cls in classes):
+            if "figure" in class_str:
                 # Check if this element contains a table (search all descendants)
                 table = node.find("table", recursive=True)
                 if table:
                     append_table(table, indent)
                 return
-            if any("sidebar" in cls for cls in classes):
+            if "sidebar" in class_str:
                 return
             
             # Skip standalone footnote blocks (we handle them inline)
-            if name in {"aside", "div", "section"} and any("footnote" in cls for cls in classes):
+            if name in {"aside", "div", "section"} and "footnote" in class_str:
                 return
 
             # Skip inline elements like sup, sub, span - they're handled by parent
@@ -638,11 +940,11 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
                 # Don't break on <br> inside inline elements - just treat as space
                 return
 
-            if name in heading_tags:
+            if name in _HEADING_TAGS:
                 # Extract heading text with proper superscript handling
                 text_parts = extract_text_with_refs(node)
                 heading_text = "".join(text_parts)
-                heading_text = re.sub(r' +', ' ', heading_text).strip()
+                heading_text = _SPACES_RE.sub(" ", heading_text).strip()
                 if heading_text:
                     append_heading(min(int(name[1]), 6), heading_text)
                 return
@@ -668,11 +970,11 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
                     # Join and normalize whitespace
                     paragraph = "".join(text_parts)
                     # Normalize multiple spaces to single space, but preserve the structure
-                    paragraph = re.sub(r' +', ' ', paragraph).strip()
+                    paragraph = _SPACES_RE.sub(" ", paragraph).strip()
                     # Clean up space before punctuation
-                    paragraph = re.sub(r'\s+([.,;:!?])', r'\1', paragraph)
+                    paragraph = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", paragraph)
                     # Ensure space after punctuation
-                    paragraph = re.sub(r'([.,;:!?])([A-Za-z])', r'\1 \2', paragraph)
+                    paragraph = _MISSING_SPACE_AFTER_PUNCT_RE.sub(r"\1 \2", paragraph)
                     
                     # Find footnote citations if any
                     inline_notes = collect_inline_footnotes(node)
@@ -694,7 +996,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
 
             next_indent = indent
             is_container = name == "section" or any(
-                keyword in cls for cls in classes for keyword in container_keywords
+                keyword in class_str for keyword in _CONTAINER_KEYWORDS
             ) or node.has_attr("data-core-component")
 
             if is_container:
@@ -707,9 +1009,6 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
                 ensure_paragraph_break()
         build_footnote_map()
 
-        # Find the main article element
-        article = soup.find("article")
-        
         if article:
             # Extract from data-core-wrapper="header" section
             header_wrapper = article.find("div", {"data-core-wrapper": "header"})
@@ -718,25 +1017,42 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
                 text_parts.append("ARTICLE HEADER\n")
                 text_parts.append("=" * 80 + "\n\n")
 
+                # Index the page's <meta> tags in one pass; looking each name up with
+                # soup.find walks the whole article whenever a tag is missing
+                meta_content: Dict[str, List[str]] = {}
+                for meta in soup.find_all("meta"):
+                    content = meta.get("content", "")
+                    for key in {meta.get("name"), meta.get("property")}:
+                        if key:
+                            meta_content.setdefault(key, []).append(content)
+
+                def first_meta(*keys: str) -> str:
+                    # Like soup.find(first key) or soup.find(next key): the first tag
+                    # found decides, even when its content is empty
+                    for key in keys:
+                        if key in meta_content:
+                            return meta_content[key][0]
+                    return ""
+
                 title = ""
-                meta_title = soup.find("meta", {"name": "citation_title"}) or soup.find("meta", {"property": "og:title"})
-                if meta_title and meta_title.get("content"):
-                    title = clean_text(meta_title.get("content"))
+                meta_title = first_meta("citation_title", "og:title")
+                if meta_title:
+                    title = _clean_text(meta_title)
                 if not title:
                     title_tag = header_wrapper.find("h1")
                     if title_tag:
-                        title = clean_text(title_tag.get_text(" ", strip=True))
+                        title = _clean_text(title_tag.get_text(" ", strip=True))
                 if title:
                     append_heading(1, title)
 
-                author_meta = [clean_text(tag.get("content", "")) for tag in soup.find_all("meta", {"name": "citation_author"})]
+                author_meta = [_clean_text(content) for content in meta_content.get("citation_author", ())]
                 authors: List[str] = []
                 for author in author_meta:
                     if author and author not in authors:
                         authors.append(author)
                 if not authors:
-                    for tag in header_wrapper.select('a[rel="author"], span[data-test="author-name"], span.author-name, span[itemprop="name"], a[itemprop="name"]'):
-                        name_text = clean_text(tag.get_text(" ", strip=True).replace("Search for articles by this author", ""))
+                    for tag in _AUTHOR_NAME_SELECTOR.select(header_wrapper):
+                        name_text = _clean_text(tag.get_text(" ", strip=True).replace("Search for articles by this author", ""))
                         if should_skip_text(name_text):
                             continue
                         if name_text and name_text not in authors:
@@ -744,21 +1060,21 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
                 if authors:
                     append_line("Authors: " + ", ".join(authors), allow_repeat=True)
 
-                journal_meta = soup.find("meta", {"name": "citation_journal_title"})
-                if journal_meta and journal_meta.get("content"):
-                    append_line(f"Journal: {clean_text(journal_meta.get('content'))}", allow_repeat=True)
+                journal_meta = first_meta("citation_journal_title")
+                if journal_meta:
+                    append_line(f"Journal: {_clean_text(journal_meta)}", allow_repeat=True)
 
-                date_meta = soup.find("meta", {"name": "citation_publication_date"}) or soup.find("meta", {"name": "dc.Date"})
-                if date_meta and date_meta.get("content"):
-                    append_line(f"Publication Date: {clean_text(date_meta.get('content'))}", allow_repeat=True)
+                date_meta = first_meta("citation_publication_date", "dc.Date")
+                if date_meta:
+                    append_line(f"Publication Date: {_clean_text(date_meta)}", allow_repeat=True)
 
-                doi_meta = soup.find("meta", {"name": "citation_doi"})
-                if doi_meta and doi_meta.get("content"):
-                    append_line(f"DOI: {clean_text(doi_meta.get('content'))}", allow_repeat=True)
+                doi_meta = first_meta("citation_doi")
+                if doi_meta:
+                    append_line(f"DOI: {_clean_text(doi_meta)}", allow_repeat=True)
 
                 keywords = []
-                for keyword_meta in soup.find_all("meta", {"name": "citation_keywords"}):
-                    keyword = clean_text(keyword_meta.get("content", ""))
+                for keyword_content in meta_content.get("citation_keywords", ()):
+                    keyword = _clean_text(keyword_content)
                     if keyword and keyword not in keywords:
                         keywords.append(keyword)
                 if keywords:
@@ -800,7 +1116,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
             abstract_elem = soup.find("section", id="author-abstract")
             if abstract_elem:
                 text_parts.append("## ABSTRACT\n\n")
-                for elem in abstract_elem.find_all(['p', 'div']):
+                for elem in _FALLBACK_ABSTRACT_SELECTOR.select(abstract_elem):
                     elem_text = elem.get_text(separator=" ", strip=True)
                     if elem_text:
                         text_parts.append(f"{elem_text}\n")
@@ -809,34 +1125,34 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
             intro_elem = soup.find("section", id="introduction")
             if intro_elem:
                 text_parts.append("\n## INTRODUCTION\n\n")
-                for elem in intro_elem.find_all(['h2', 'h3', 'h4', 'p']):
-                    if elem.name in ['h2', 'h3', 'h4']:
+                for elem in _FALLBACK_INTRO_SELECTOR.select(intro_elem):
+                    if elem.name != 'p':
                         level = int(elem.name[1])
                         elem_text = elem.get_text(strip=True)
                         if elem_text:
                             text_parts.append(f"\n{'#' * level} {elem_text}\n\n")
                     else:
                         elem_text = elem.get_text(separator=" ", strip=True)
-                        if elem_text and not elem.find_parent('figure'):
+                        if elem_text:
                             text_parts.append(f"{elem_text}\n")
             
             # Extract all other body sections
             body_elem = soup.find("section", id="bodymatter")
             if body_elem:
                 text_parts.append("\n## MAIN CONTENT\n\n")
-                for elem in body_elem.find_all(['h2', 'h3', 'h4', 'h5', 'h6', 'p']):
-                    if elem.name in ['h2', 'h3', 'h4', 'h5', 'h6']:
+                for elem in _FALLBACK_BODY_SELECTOR.select(body_elem):
+                    if elem.name != 'p':
                         level = int(elem.name[1])
                         elem_text = elem.get_text(strip=True)
                         if elem_text:
                             text_parts.append(f"\n{'#' * level} {elem_text}\n\n")
                     else:
                         elem_text = elem.get_text(separator=" ", strip=True)
-                        if elem_text and not elem.find_parent('figure'):
+                        if elem_text:
                             text_parts.append(f"{elem_text}\n")
         
-        # Extract figure captions (from anywhere in the page)
-        figures = soup.find_all("figure")
+        # Extract figure captions (from anywhere in the article)
+        figures = cleanup_root.find_all("figure")
         figures_text = []  # Collect figures for JSON
         if figures:
             text_parts.append("\n" + "=" * 80 + "\n")
@@ -907,23 +1223,22 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
                             # Use extract_text_with_refs for proper superscript/reference handling
                             para_parts = extract_text_with_refs(para)
                             para_text = "".join(para_parts).strip()
-                            para_text = re.sub(r' +', ' ', para_text)
+                            para_text = _SPACES_RE.sub(" ", para_text)
                             
                             if para_text and len(para_text) > 10:  # Skip very short text fragments
                                 # Remove button text like "Hide caption" or "Figure viewer"
-                                if para_text not in ['Hide caption', 'Figure viewer', 'Show caption', 'Collapse', 'Expand']:
+                                if para_text not in _CAPTION_NOISE:
                                     text_parts.append(f"{para_text}\n\n")
                                     figure_caption_parts.append(para_text)
                     else:
                         # Fallback: get all text from caption
                         caption_parts = extract_text_with_refs(caption)
                         caption_text = "".join(caption_parts).strip()
-                        caption_text = re.sub(r' +', ' ', caption_text)
+                        caption_text = _SPACES_RE.sub(" ", caption_text)
                         
                         if caption_text:
                             # Clean up button text
-                            caption_text = caption_text.replace('Hide caption', '').replace('Figure viewer', '')
-                            caption_text = caption_text.replace('Show caption', '').replace('Collapse', '').replace('Expand', '')
+                            caption_text = _CAPTION_NOISE_RE.sub('', caption_text)
                             caption_text = ' '.join(caption_text.split())  # Normalize whitespace
                             if caption_text:
                                 text_parts.append(f"{caption_text}\n\n")
@@ -945,7 +1260,7 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
         
         # Add references as a separate section in JSON
         reference_entries = get_reference_entries()
-        if reference_entries and "REFERENCES" not in "\n".join(text_parts):
+        if reference_entries and not any("REFERENCES" in part for part in text_parts):
             text_parts.append("\n" + "=" * 80 + "\n")
             text_parts.append("REFERENCES\n")
             text_parts.append("=" * 80 + "\n\n")
@@ -960,10 +1275,10 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
             if references_text:
                 json_data["references"] = "\n".join(references_text)
         
-        full_text = "".join(text_parts)
-        
-        if json_data or full_text.strip():
-            logger.info(f"✅ Successfully extracted {len(json_data)} sections with {len(full_text)} characters total")
+        # text_parts is only inspected, never returned: avoid joining the whole document
+        if json_data or any(part.strip() for part in text_parts):
+            total_chars = sum(map(len, text_parts))
+            logger.info(f"✅ Successfully extracted {len(json_data)} sections with {total_chars} characters total")
             return json_data
         else:
             logger.warning("⚠️ No text content extracted from page")
@@ -975,9 +1290,20 @@ async def extract_fulltext_as_json(page: Page, fulltext_url: str) -> Optional[Di
         return None
 
 
+def _write_json(json_content: Dict, file_path: str) -> None:
+    # Serialize up front and write the bytes in one call; json.dump would
+    # push hundreds of small chunks through the text layer
+    data = json.dumps(json_content, ensure_ascii=False, indent=2).encode('utf-8')
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
+
 async def save_json_to_file(json_content: Dict, file_path: str) -> bool:
     """Save extracted content to a .json file.
     
+    The write runs in a worker thread so concurrent extractions keep
+    making progress while the file is written.
+    
     Args:
         json_content: The JSON content to save (dict with sections as keys)
         file_path: Absolute path where the file should be saved
@@ -986,8 +1312,7 @@ async def save_json_to_file(json_content: Dict, file_path: str) -> bool:
         bool: True if saved successfully, False otherwise
     """
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(json_content, f, ensure_ascii=False, indent=2)
+        await asyncio.to_thread(_write_json, json_content, file_path)
         logger.info(f"💾 Saved JSON to: {file_path}")
         return True
     except Exception as e:
@@ -995,6 +1320,88 @@ async def save_json_to_file(json_content: Dict, file_path: str) -> bool:
         return False
 
 
+# Archives are written through a 1 MiB buffer instead of the 8 KiB default,
+# so many small member writes turn into few large write() calls
+_ARCHIVE_WRITE_BUFFER = 1 << 20
+
+
+# Members whose first 8 KiB shrink by less than 10% are stored uncompressed
+_STORE_SAMPLE_SIZE = 8192
+_STORE_RATIO = 0.9
+
+
+def _zip_compress_type(data: bytes) -> int:
+    """Pick ZIP_STORED for members DEFLATE would barely shrink, ZIP_DEFLATED otherwise."""
+    sample = data[:_STORE_SAMPLE_SIZE]
+    if sample and len(zlib.compress(sample, 1)) > _STORE_RATIO * len(sample):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+# Level 1 is several times faster than the default (6) on JSON text and only
+# costs a few percent of archive size; ZIP_COMPRESSLEVEL (0-9) overrides it
+_DEFAULT_ZIP_COMPRESSLEVEL = 1
+
+
+def _zip_compresslevel() -> int:
+    """DEFLATE level for the ZIP archive, read from the ZIP_COMPRESSLEVEL env var."""
+    value = os.environ.get("ZIP_COMPRESSLEVEL")
+    if value is None:
+        return _DEFAULT_ZIP_COMPRESSLEVEL
+    try:
+        level = int(value)
+    except ValueError:
+        level = -1
+    if not 0 <= level <= 9:
+        logger.warning(f"⚠️ Ignoring invalid ZIP_COMPRESSLEVEL={value!r}, using {_DEFAULT_ZIP_COMPRESSLEVEL}")
+        return _DEFAULT_ZIP_COMPRESSLEVEL
+    return level
+
+
+def _write_zip(archive_path: str, members: List[Tuple[str, str]]) -> None:
+    """Write `members` ((file_path, arcname) pairs) to a DEFLATE-compressed ZIP archive."""
+    level = _zip_compresslevel()
+    logger.info(f"📦 ZIP compression level: {level}")
+    with open(archive_path, 'wb', buffering=_ARCHIVE_WRITE_BUFFER) as raw, \
+            zipfile.ZipFile(raw, 'w', zipfile.ZIP_DEFLATED, compresslevel=level, allowZip64=True) as zipf:
+        for file_path, arcname in members:
+            # Members are small JSON files: read each in one call and hand the whole
+            # buffer to the compressor instead of streaming it in 8 KiB chunks
+            info = zipfile.ZipInfo.from_file(file_path, arcname)
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            zipf.writestr(info, data, compress_type=_zip_compress_type(data), compresslevel=zipf.compresslevel)
+
+
+def _write_tar_zst(archive_path: str, members: List[Tuple[str, str]]) -> None:
+    """Write `members` ((file_path, arcname) pairs) to a zstd-compressed tar archive.
+    
+    Uses all cores (threads=-1); level 3 compresses JSON text faster than
+    single-threaded DEFLATE and to a smaller archive.
+    """
+    cctx = zstandard.ZstdCompressor(level=3, threads=-1, write_checksum=True)
+    with open(archive_path, 'wb', buffering=_ARCHIVE_WRITE_BUFFER) as raw, cctx.stream_writer(raw) as zfh, tarfile.open(fileobj=zfh, mode='w|') as tar:
+        for file_path, arcname in members:
+            tar.add(file_path, arcname=arcname)
+
+
+def _write_tar_zst_cli(archive_path: str, members: List[Tuple[str, str]]) -> None:
+    """Same as _write_tar_zst, but pipes the tar stream through the external `zstd` command."""
+    proc = subprocess.Popen(
+        ["zstd", "-T0", "-3", "-q", "-f", "-o", archive_path],
+        stdin=subprocess.PIPE,
+    )
+    try:
+        with tarfile.open(fileobj=proc.stdin, mode='w|') as tar:
+            for file_path, arcname in members:
+                tar.add(file_path, arcname=arcname)
+    finally:
+        proc.stdin.close()
+        returncode = proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"zstd exited with status {returncode}")
+
+
 async def crawl_text_async(
     keywords: str = "",
     year_from: int = 2020,
@@ -1006,6 +1413,9 @@ async def crawl_text_async(
     progress_callback=None,
     total_progress_callback=None,
     crawl_archives: bool = False,
+    max_concurrency: int = CONTEXT_POOL_SIZE,
+    archive_format: str = "zip",
+    max_journals: int = JOURNAL_CONCURRENCY,
 ) -> Tuple[List[str], List[str]]:
     """Async crawl Cell.com for articles and extract full-text HTML as plain text.
     
@@ -1023,17 +1433,33 @@ async def crawl_text_async(
         progress_callback: Called with (filename, filepath) after each file is saved
         total_progress_callback: Called with (current, total, status, file_size, speed, stage)
         crawl_archives: If True, also crawl /issue pages for archived articles
+        max_concurrency: Number of articles extracted at the same time, across all
+            journals (one browser context each); 1 extracts articles one by one
+        archive_format: Format of the end-of-run archive, "zip" or "tar.zst"
+            ("tar.zst" needs the optional zstandard package, otherwise a ZIP is written)
+        max_journals: Number of journals crawled at the same time; 1 crawls them one by one
     
     Returns:
         Tuple[List[str], List[str]]: (saved_file_paths, open_access_article_names)
     """
     
     os.makedirs(out_folder, exist_ok=True)
+    pool_size = max(1, max_concurrency)
     saved_files = []
+    # (file_path, arcname) of every saved JSON, in save order, for the end-of-run archive
+    archive_members: List[Tuple[str, str]] = []
+    # Journals that had at least one article saved in this run
+    saved_journals: Set[str] = set()
     open_access_articles = []
-    article_metadata = []  # Store (file_path, article_title, publish_date)
     total_articles_found = 0
     
+    # Extraction summary CSV, written row by row as articles are saved
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    csv_filename = f"extraction_summary_{timestamp}.csv"
+    csv_path = os.path.join(out_folder, csv_filename)
+    csv_file = None
+    csv_writer = None
+    
     # Initialize CLI progress tracker (only if no callbacks provided)
     cli_progress = None
     if not progress_callback and not total_progress_callback:
@@ -1045,53 +1471,207 @@ async def crawl_text_async(
         init_scripts_only=True
     )
 
+    # Consent rules, reordered so the button that last worked is tried first
+    cookie_rules = list(_COOKIE_RULES)
+
+    # Contexts whose consent banner was already handled; consent is a cookie,
+    # so later pages of the same context never show the banner again
+    consent_handled = weakref.WeakSet()
+
     async def handle_cookie_consent(page):
-        """Try to accept cookie consent if it appears."""
+        """Try to accept cookie consent if it appears (once per browser context)."""
+        if page.context in consent_handled:
+            return True
+        consent_handled.add(page.context)
         try:
-            cookie_selectors = [
-                'button:has-text("Accept")',
-                'button:has-text("Accept all")',
-                'button:has-text("Accept All")',
-                'button:has-text("I Accept")',
-                'button:has-text("I agree")',
-                'button:has-text("Agree")',
-                'button:has-text("OK")',
-                'button[id*="accept"]',
-                'button[class*="accept"]',
-                'a:has-text("Accept")',
-                '#onetrust-accept-btn-handler',
-                '.optanon-alert-box-button-middle',
-            ]
-            
-            for selector in cookie_selectors:
-                try:
-                    if await page.locator(selector).is_visible(timeout=2000):
-                        await page.click(selector, timeout=3000)
-                        await page.wait_for_timeout(1000)
-                        return True
-                except Exception:
-                    continue
-                    
+            # The probe runs in the page and is re-evaluated there until a button
+            # shows up, so a late-rendering banner costs no extra round-trips
+            # Probe a snapshot: other journals may reorder cookie_rules meanwhile
+            rules = list(cookie_rules)
+            handle = await page.wait_for_function(_COOKIE_PROBE_JS, arg=rules, timeout=1500)
+            matched = await handle.json_value()
+            winner = rules[matched - 1]
+            cookie_rules.remove(winner)
+            cookie_rules.insert(0, winner)
+            await page.wait_for_timeout(300)
+            return True
         except Exception as e:
             logger.debug(f"No cookie consent found or already accepted: {e}")
         
         return False
 
+    async def new_stealth_context(browser):
+        """Create a browser context with the crawler's browser fingerprint.
+        
+        The stealth patches and the webdriver override are registered on the
+        context, so every page opened in it gets them without per-page setup.
+        """
+        context = await browser.new_context(**_CONTEXT_OPTIONS)
+        await context.add_cookies(_CONSENT_COOKIES)
+        await stealth.apply_stealth_async(context)
+        await context.add_init_script(_STEALTH_INIT_JS)
+        return context
+
+    async def open_pool_page(browser):
+        """Open a fresh context for article extraction and return its stealth page.
+        
+        Pooled contexts only load article pages, so images, fonts, media and
+        stylesheets are blocked on them.
+        """
+        pool_context = await new_stealth_context(browser)
+        await pool_context.route("**/*", _block_heavy_resources)
+        return await pool_context.new_page()
+
+    async def open_context_pool(browser, size: int) -> asyncio.Queue:
+        """Open `size` contexts with one stealth page each, queued for checkout."""
+        pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(size):
+            pool.put_nowait(await open_pool_page(browser))
+        return pool
+
+    # Articles extracted per pooled page since its context was opened
+    page_uses: Dict = {}
+
+    async def release_page(pool: asyncio.Queue, page) -> None:
+        """Return a page to the pool, recycling its context after _CONTEXT_RECYCLE_PAGES articles.
+        
+        Long-lived Firefox contexts keep growing in memory, so a worn-out
+        context is closed and replaced by a fresh one.
+        """
+        uses = page_uses.pop(page, 0) + 1
+        if uses < _CONTEXT_RECYCLE_PAGES:
+            page_uses[page] = uses
+            pool.put_nowait(page)
+            return
+        
+        old_context = page.context
+        try:
+            fresh_page = await open_pool_page(old_context.browser)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not recycle browser context, keeping the old one: {e}")
+            pool.put_nowait(page)
+            return
+        pool.put_nowait(fresh_page)
+        logger.debug(f"♻️ Recycled browser context after {uses} articles")
+        try:
+            await old_context.close()
+        except Exception:
+            pass
+
+    async def close_context_pool(pool: asyncio.Queue) -> None:
+        """Close the contexts of all pooled pages."""
+        while not pool.empty():
+            page = pool.get_nowait()
+            page_uses.pop(page, None)
+            await page.context.close()
+
+    def write_summary_row(journal_name: str, article_title: str, publish_date: str, file_path: str, file_size: int) -> None:
+        """Append a saved article to the summary CSV, creating the file on first use."""
+        nonlocal csv_file, csv_writer
+        try:
+            if csv_writer is None:
+                print(f"\n📄 Creating extraction summary CSV: {csv_filename}")
+                csv_file = open(csv_path, 'w', newline='', encoding='utf-8')
+                csv_writer = csv.writer(csv_file)
+                csv_writer.writerow(['Number', 'Journal', 'Article Name', 'Publish Date', 'File Path', 'File Size (KB)'])
+            csv_writer.writerow([found_count, journal_name, article_title, publish_date, file_path, f"{file_size / 1024:.2f}"])
+            csv_file.flush()
+        except Exception as e:
+            logger.error(f"❌ Failed to write CSV summary row: {e}")
+
+    progress_started = False
+
+    def add_articles_found(count: int) -> None:
+        """Add a journal's extraction target to the crawl-wide progress total.
+        
+        Journals are crawled concurrently, so this is the only place the total
+        changes; the CLI progress bar is started once, by the first journal with
+        articles, and later journals only raise its total.
+        """
+        nonlocal total_articles_found, progress_started
+        total_articles_found += count
+        if total_progress_callback:
+            total_progress_callback(found_count, total_articles_found, f"Found {total_articles_found} open access articles", 0, 0, "found")
+        elif cli_progress and total_articles_found > 0:
+            if not progress_started:
+                progress_started = True
+                cli_progress.start(total_articles_found)
+            else:
+                cli_progress.total = total_articles_found
+                if cli_progress.pbar is not None:
+                    cli_progress.pbar.total = total_articles_found
+                    cli_progress.pbar.refresh()
+
     found_count = 0
+    # Paths of JSON files already on disk (from earlier runs) or saved in this run
+    extracted_paths: Set[str] = set()
+    # Full-text URLs (without query string) already queued in this run; archive
+    # issues often re-list articles from /newarticles under a slightly different title
+    seen_urls: Set[str] = set()
+    # Destination paths of candidates in the batch being extracted; two citations
+    # with the same sanitised title must not be written to the same file at once
+    queued_paths: Set[str] = set()
     
-    async def crawl_issue_page(page, issue_url: str, journal_folder: str, journal_download_count: int, is_open_archive: bool = False, issue_date: str = "Unknown"):
-        """Crawl a specific issue page for articles and extract text."""
-        nonlocal found_count, saved_files, open_access_articles, article_metadata
+    def build_candidate(art: Tag, journal_folder: str, publish_date: str, kind: str, queued: int) -> Optional[Tuple[str, str, str, str, str, str]]:
+        """Turn an article citation into an extraction candidate.
+        
+        Args:
+            art: The articleCitation element
+            journal_folder: Folder the article JSON is saved to
+            publish_date: Publish date recorded in the summary CSV
+            kind: Label used in the progress output ('open-access' or 'open-archive')
+            queued: Number of candidates already collected, used to name untitled articles
+        
+        Returns:
+            (article_title, fulltext_link, publish_date, filename, dest_path, journal_name),
+            or None if the citation has no full-text link, its URL was already queued
+            in this run, or its JSON is already on disk
+        """
+        fulltext_link = _find_fulltext_href(art)
+        if not fulltext_link:
+            return None
+        
+        # Make absolute URL
+        if not fulltext_link.startswith("http"):
+            fulltext_link = f"https://www.cell.com{fulltext_link}"
+        
+        url_key = fulltext_link.split("?", 1)[0]
+        if url_key in seen_urls:
+            return None
+        seen_urls.add(url_key)
+        
+        title_elem = _ARTICLE_TITLE_SELECTOR.select_one(art)
+        article_title = title_elem.get_text(strip=True) if title_elem else f"Article {found_count + queued + 1}"
         
+        filename = f"{_safe_title(article_title)}.json"
+        dest_path = os.path.join(journal_folder, filename)
+        
+        if dest_path in extracted_paths:
+            logger.info(f"⏭️  Skipping already extracted: {filename}")
+            return None
+        if dest_path in queued_paths:
+            logger.info(f"⏭️  Skipping duplicate title already queued: {filename}")
+            return None
+        queued_paths.add(dest_path)
+        
+        logger.info(f"📄 Found {kind} article: {article_title[:60]}...")
+        
+        return (article_title, fulltext_link, publish_date, filename, dest_path, os.path.basename(journal_folder))
+
+    async def crawl_issue_page(page, issue_url: str, journal_folder: str, journal_download_count: int, pool: asyncio.Queue, is_open_archive: bool = False, issue_date: str = "Unknown"):
+        """Crawl a specific issue page for articles and extract text.
+        
+        The issue page itself is loaded on `page`; its articles are extracted
+        concurrently on pages checked out from `pool`.
+        """
         print(f"📖 Loading issue: {issue_url}", flush=True)
         print(f"📅 Issue date (from list): {issue_date}", flush=True)
-        await page.goto(issue_url, timeout=30000)
-        await page.wait_for_timeout(2000)
+        await _goto_listing(page, issue_url, ".articleCitation")
         
         await handle_cookie_consent(page)
         
-        html = await page.content()
-        soup = BeautifulSoup(html, "html.parser")
+        html = await page.evaluate(_LISTING_HTML_JS, _ISSUE_PAGE_SELECTOR)
+        soup = BeautifulSoup(html, "lxml", parse_only=_ISSUE_PAGE_STRAINER)
         
         if issue_date == "Unknown":
             logger.warning(f"⚠️ No date provided for issue, attempting to extract from page...")
@@ -1112,544 +1692,516 @@ async def crawl_text_async(
                         print(f"📅 Extracted date from page: {issue_date}", flush=True)
                         break
         
-        articles = soup.select(".articleCitation")
+        articles = _ARTICLE_CITATION_SELECTOR.select(soup)
         print(f"Found {len(articles)} articles in issue", flush=True)
         
+        kind = 'open-archive' if is_open_archive else 'open-access'
+        candidates = []
         for art in articles:
-            if limit and journal_download_count >= limit:
-                logger.info(f"✋ Reached journal limit of {limit} extractions")
-                return journal_download_count, True
-            
-            oa_label = art.find(class_="OALabel")
-            if not is_open_archive and not oa_label:
+            if not is_open_archive and _OA_LABEL_SELECTOR.select_one(art) is None:
                 continue
             
-            # Find Full-Text HTML link
-            fulltext_link = None
-            for link in art.find_all("a", href=True):
-                if "Full-Text HTML" in link.get_text() or "/fulltext/" in link.get("href", ""):
-                    fulltext_link = link.get("href", "")
-                    break
+            candidate = build_candidate(art, journal_folder, issue_date, kind, len(candidates))
+            if candidate:
+                candidates.append(candidate)
+        
+        journal_download_count = await extract_candidates(pool, candidates, journal_download_count)
+        
+        if limit and journal_download_count >= limit:
+            logger.info(f"✋ Reached journal limit of {limit} extractions")
+            return journal_download_count, True
+        
+        return journal_download_count, False
+
+    async def extract_article(page, candidate) -> Optional[Tuple[Dict, float]]:
+        """Load one article on `page` and extract it to JSON.
+        
+        Returns:
+            Tuple of (json_content, extract_start_time), or None if extraction failed
+        """
+        article_title, fulltext_link = candidate[0], candidate[1]
+        
+        try:
+            if total_progress_callback:
+                total_progress_callback(found_count, found_count + 1, f"Extracting: {article_title[:50]}...", 0, 0, "starting")
+            elif cli_progress:
+                cli_progress.update(found_count, max(total_articles_found, found_count + 1), f"📝 {article_title[:30]}...", 0, 0, "starting")
+            else:
+                logger.info(f"📝 Start extracting text: {article_title[:50]}...")
+            
+            extract_start_time = time.time()
             
-            if not fulltext_link:
-                continue
+            json_content = await extract_fulltext_as_json(page, fulltext_link)
             
-            # Make absolute URL
-            if not fulltext_link.startswith("http"):
-                fulltext_link = f"https://www.cell.com{fulltext_link}"
+            if not json_content:
+                logger.error(f"❌ Extracted text is too small or empty")
+                return None
             
-            title_elem = art.find(class_="toc__item__title")
-            article_title = title_elem.get_text(strip=True) if title_elem else f"Article {found_count + 1}"
-            publish_date = issue_date
+            return json_content, extract_start_time
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to extract text for '{article_title[:50]}': {e}")
+            logger.debug(traceback.format_exc())
+            return None
+
+    async def save_article(candidate, json_content: Dict, extract_start_time: float) -> bool:
+        """Save an extracted article and record it. Returns True if the file was saved."""
+        nonlocal found_count
+        article_title, fulltext_link, publish_date, filename, dest_path, journal_name = candidate
+        
+        try:
+            success = await save_json_to_file(json_content, dest_path)
             
-            print(f"📄 Found {'open-archive' if is_open_archive else 'open-access'} article: {article_title[:60]}...", flush=True)
+            extract_time = time.time() - extract_start_time
             
             try:
-                safe_title = "".join(c for c in article_title if c.isalnum() or c in (' ', '-', '_')).strip()
-                safe_title = safe_title[:100]
-                filename = f"{safe_title}.json"
-                dest_path = os.path.join(journal_folder, filename)
-                
-                if os.path.exists(dest_path) and os.path.getsize(dest_path) > 100:
-                    logger.info(f"⏭️  Skipping already extracted: {filename}")
-                    continue
-                
-                if total_progress_callback:
-                    total_progress_callback(found_count, found_count + 1, f"Extracting: {article_title[:50]}...", 0, 0, "starting")
-                elif cli_progress:
-                    cli_progress.update(found_count, found_count + 1, f"📝 {article_title[:30]}...", 0, 0, "starting", force=True)
-                else:
-                    logger.info(f"📝 Start extracting text: {article_title[:50]}...")
-                
-                extract_start_time = time.time()
-                
-                print(f"🔗 Navigating to full-text: {fulltext_link[:80]}...", flush=True)
-                
-                # Extract JSON from full-text page
-                json_content = await extract_fulltext_as_json(page, fulltext_link)
-                
-                print(f"✅ Extraction completed. Sections: {len(json_content) if json_content else 0}", flush=True)
-                
-                if json_content:
-                    # Save to JSON file
-                    success = await save_json_to_file(json_content, dest_path)
-                    
-                    extract_time = time.time() - extract_start_time
-                    
-                    if success and os.path.exists(dest_path):
-                        file_size = os.path.getsize(dest_path)
-                        file_size_kb = file_size / 1024
-                        
-                        if extract_time > 0:
-                            speed_kbps = file_size_kb / extract_time
-                        else:
-                            speed_kbps = 0
-                        
-                        if cli_progress is None:
-                            print(f"✅ Extracted {file_size_kb:.1f} KB in {extract_time:.1f}s ({speed_kbps:.1f} KB/s)", flush=True)
-                        
-                        saved_files.append(dest_path)
-                        open_access_articles.append(article_title)
-                        article_metadata.append((dest_path, article_title, publish_date))
-                        found_count += 1
-                        journal_download_count += 1
-                        
-                        if progress_callback:
-                            progress_callback(filename, dest_path)
-                        
-                        if total_progress_callback:
-                            total_progress_callback(found_count, found_count, f"Saved: {article_title[:50]}...", file_size, speed_kbps, "completed")
-                        elif cli_progress:
-                            cli_progress.update(found_count, found_count, f"✅ {article_title[:30]}...", file_size, speed_kbps, "completed")
-                    else:
-                        print(f"❌ Failed to save JSON file: {dest_path}", flush=True)
-                else:
-                    print(f"❌ Extracted JSON is empty or invalid", flush=True)
-                    
-            except Exception as e:
-                print(f"❌ Failed to extract text for '{article_title[:50]}': {e}", flush=True)
-                print(traceback.format_exc(), flush=True)
+                file_size = os.stat(dest_path).st_size if success else None
+            except FileNotFoundError:
+                file_size = None
+            if file_size is None:
+                logger.error(f"❌ Failed to save text file: {dest_path}")
+                return False
+            
+            file_size_kb = file_size / 1024
+            
+            if extract_time > 0:
+                speed_kbps = file_size_kb / extract_time
+            else:
+                speed_kbps = 0
+            
+            if cli_progress is None:
+                print(f"✅ Extracted {file_size_kb:.1f} KB in {extract_time:.1f}s ({speed_kbps:.1f} KB/s)", flush=True)
+            
+            saved_files.append(dest_path)
+            archive_members.append((dest_path, os.path.join(journal_name, filename)))
+            saved_journals.add(journal_name)
+            extracted_paths.add(dest_path)
+            open_access_articles.append(article_title)
+            found_count += 1
+            write_summary_row(journal_name, article_title, publish_date, dest_path, file_size)
+            
+            if progress_callback:
+                progress_callback(filename, dest_path)
             
-            await asyncio.sleep(1)
+            if total_progress_callback:
+                total_progress_callback(found_count, found_count, f"Saved: {article_title[:50]}...", file_size, speed_kbps, "completed")
+            elif cli_progress:
+                cli_progress.update(found_count, max(total_articles_found, found_count), f"✅ {article_title[:30]}...", file_size, speed_kbps, "completed")
+            return True
         
-        return journal_download_count, False
+        except Exception as e:
+            logger.error(f"❌ Failed to save text for '{article_title[:50]}': {e}")
+            logger.debug(traceback.format_exc())
+            return False
 
-    if journal_slugs:
-        if total_progress_callback:
-            total_progress_callback(0, 0, "Scanning journals for open access articles...", 0, 0, "scanning")
-        elif cli_progress:
-            print(f"🔍 Scanning {len(journal_slugs)} journal(s) for open access articles...", flush=True)
+    # Earliest time the next article navigation may start, shared by all workers
+    next_request_at = 0.0
+    request_slot_lock = asyncio.Lock()
+
+    async def wait_for_request_slot() -> None:
+        """Global rate limit: space article navigations of all workers by a jittered interval."""
+        nonlocal next_request_at
+        async with request_slot_lock:
+            now = time.monotonic()
+            if next_request_at > now:
+                await asyncio.sleep(next_request_at - now)
+            next_request_at = max(now, next_request_at) + random.uniform(*_REQUEST_INTERVAL)
+
+    async def extract_candidates(pool: asyncio.Queue, candidates: List[Tuple[str, str, str, str, str, str]], journal_download_count: int) -> int:
+        """Extract candidates concurrently, one worker per pooled page.
+        
+        A page goes back to the pool as soon as its article is extracted; the
+        JSON is saved in a background task so the worker can start the next
+        navigation while the previous file is being written.
+        
+        Workers stop picking up new articles once saved plus in-flight extractions
+        (including pending saves) reach the per-journal limit, so the limit is never
+        overshot. A worker whose extraction fails keeps going, so failures don't
+        leave the limit unfilled.
+        
+        Returns:
+            int: Updated per-journal download count
+        """
+        pending = iter(candidates)
+        in_flight = 0
+        saves: Set[asyncio.Task] = set()
+        
+        async def finish(candidate, json_content, extract_start_time):
+            nonlocal journal_download_count, in_flight
+            try:
+                if await save_article(candidate, json_content, extract_start_time):
+                    journal_download_count += 1
+            finally:
+                in_flight -= 1
         
-        async with async_playwright() as p:
-            for slug in journal_slugs:
-                print(f"\n🚀 Launching Firefox for journal: {slug}...", flush=True)
+        async def worker():
+            nonlocal in_flight
+            while not (limit and journal_download_count + in_flight >= limit):
+                candidate = next(pending, None)
+                if candidate is None:
+                    return
+                in_flight += 1
+                page = await pool.get()
+                try:
+                    await wait_for_request_slot()
+                    extracted = await extract_article(page, candidate)
+                finally:
+                    await release_page(pool, page)
                 
+                if extracted is None:
+                    in_flight -= 1
+                else:
+                    task = asyncio.create_task(finish(candidate, *extracted))
+                    saves.add(task)
+                    task.add_done_callback(saves.discard)
+        
+        # Other journals may hold pages right now; spare workers just wait for one
+        workers = [asyncio.create_task(worker()) for _ in range(pool_size)]
+        try:
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                # A worker failed: stop the others so their pages go back to the pool
+                # before the error reaches the caller, and let pending saves finish
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, *saves, return_exceptions=True)
+                raise
+            if saves:
+                await asyncio.gather(*saves)
+        finally:
+            # Saved paths are now in extracted_paths; failed or unstarted ones may be
+            # picked up again from a later listing
+            queued_paths.difference_update(candidate[4] for candidate in candidates)
+        return journal_download_count
+
+    try:
+        if journal_slugs:
+            if total_progress_callback:
+                total_progress_callback(0, 0, "Scanning journals for open access articles...", 0, 0, "scanning")
+            elif cli_progress:
+                print(f"🔍 Scanning {len(journal_slugs)} journal(s) for open access articles...", flush=True)
+            
+            async with async_playwright() as p:
+                print(f"\n🚀 Launching Firefox...", flush=True)
                 browser = await p.firefox.launch(headless=headless)
+                print(f"✅ Firefox browser ready", flush=True)
                 
-                context = await browser.new_context(
-                    accept_downloads=False,  # Not downloading files
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:143.0) Gecko/20100101 Firefox/143.0',
-                    viewport={'width': 1920, 'height': 1080},
-                    locale='en-US',
-                    timezone_id='America/New_York',
-                    permissions=['geolocation'],
-                    geolocation={'longitude': -74.0060, 'latitude': 40.7128},
-                    color_scheme='light',
-                    extra_http_headers={
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1',
-                    }
-                )
-                
-                print(f"✅ Firefox browser ready for {slug}", flush=True)
-                
-                page = await context.new_page()
-                
-                await stealth.apply_stealth_async(page)
-                
-                await page.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                """)
-                
-                journal_folder = os.path.join(out_folder, slug.replace('/', '_'))
-                os.makedirs(journal_folder, exist_ok=True)
-                print(f"📂 Journal folder: {journal_folder}")
-                
-                url = f"https://www.cell.com/{slug}/newarticles"
-                print(f"🔎 Crawling journal: {slug} at {url}")
-                
-                if total_progress_callback:
-                    total_progress_callback(found_count, total_articles_found, f"Loading journal: {slug}", 0, 0, "loading")
-                
-                await page.goto(url, timeout=30000)
-                await page.wait_for_timeout(3000)
-                
-                await handle_cookie_consent(page)
-                
-                page_title = await page.title()
-                
-                html = await page.content()
-                soup = BeautifulSoup(html, "html.parser")
-                articles = soup.select(".articleCitation")
-                
-                if not articles:
-                    print(f"⚠️ No articles found on {url}. Page title: {page_title}")
-                    await page.close()
-                    await context.close()
-                    await browser.close()
-                    continue
-                
-                oa_count = sum(1 for art in articles if art.find(class_="OALabel"))
-                journal_download_count = 0
-                journal_target = min(oa_count, limit) if limit else oa_count
-                total_articles_found += journal_target
-                print(f"📚 Found {oa_count} open access articles in {slug} (will extract up to {journal_target})")
-                
-                if total_progress_callback:
-                    total_progress_callback(found_count, total_articles_found, f"Found {total_articles_found} open access articles", 0, 0, "found")
-                elif cli_progress:
-                    if cli_progress.total == 0 and total_articles_found > 0:
-                        cli_progress.start(total_articles_found)
-                    else:
-                        cli_progress.total = total_articles_found
+                # Journals are crawled concurrently (their listing and archive pages
+                # each in the journal's own context); article extraction of all of them
+                # shares one context pool and the global request rate limit
+                print(f"🔧 Opening {pool_size} browser contexts for article extraction...", flush=True)
+                pool = await open_context_pool(browser, pool_size)
+                journal_slots = asyncio.Semaphore(max(1, max_journals))
                 
-                for art in articles:
-                    if limit and journal_download_count >= limit:
-                        print(f"✋ Reached limit of {limit} for journal {slug}", flush=True)
-                        break
-                    
-                    year_tag = art.find(class_="toc__item__date")
-                    year_text = year_tag.get_text() if year_tag else ""
-                    try:
-                        if "," in year_text:
-                            year_str = year_text.split(",")[-1].strip()
-                        else:
-                            year_str = year_text.strip()
-                        year = int(re.search(r'\d{4}', year_str).group()) if re.search(r'\d{4}', year_str) else 0
-                    except Exception:
-                        year = 0
-                    
-                    if not (year_from <= year <= year_to):
-                        continue
-                    
-                    # Find Full-Text HTML link
-                    fulltext_link = None
-                    for link in art.find_all("a", href=True):
-                        if "Full-Text HTML" in link.get_text() or "/fulltext/" in link.get("href", ""):
-                            fulltext_link = link.get("href", "")
-                            break
-                    
-                    if not fulltext_link:
-                        continue
-                    
-                    oa_label = art.find(class_="OALabel")
-                    if not oa_label:
-                        continue
-                    
-                    # Make absolute URL
-                    if not fulltext_link.startswith("http"):
-                        fulltext_link = f"https://www.cell.com{fulltext_link}"
-                    
-                    title_elem = art.find(class_="toc__item__title")
-                    article_title = title_elem.get_text(strip=True) if title_elem else f"Article {found_count + 1}"
-                    publish_date = year_text.strip() if year_text else "Unknown"
-                    
-                    print(f"📄 Found open-access article: {article_title[:60]}...")
-                    
-                    try:
-                        safe_title = "".join(c for c in article_title if c.isalnum() or c in (' ', '-', '_')).strip()
-                        safe_title = safe_title[:100]
-                        filename = f"{safe_title}.json"
-                        dest_path = os.path.join(journal_folder, filename)
-                        
-                        if os.path.exists(dest_path) and os.path.getsize(dest_path) > 100:
-                            logger.info(f"⏭️  Skipping already extracted: {filename}")
-                            continue
-                        
-                        if total_progress_callback:
-                            total_progress_callback(found_count, found_count + 1, f"Extracting: {article_title[:50]}...", 0, 0, "starting")
-                        elif cli_progress:
-                            cli_progress.update(found_count, found_count + 1, f"📝 {article_title[:30]}...", 0, 0, "starting", force=True)
-                        else:
-                            logger.info(f"📝 Start extracting text: {article_title[:50]}...")
-                        
-                        extract_start_time = time.time()
-                        
-                        print(f"🔗 Navigating to full-text: {fulltext_link[:80]}...", flush=True)
-                        
-                        json_content = await extract_fulltext_as_json(page, fulltext_link)
-                        
-                        if json_content:
-                            # Save to JSON file
-                            success = await save_json_to_file(json_content, dest_path)
+                async def crawl_journal(slug: str) -> None:
+                    """Crawl one journal: its /newarticles listing and, if needed, its issue archive."""
+                    async with journal_slots:
+                        # One browser for the whole crawl; each journal gets its own context
+                        print(f"\n🧭 Opening browser context for journal: {slug}...", flush=True)
+                        context = await new_stealth_context(browser)
+                        page = archive_page = None
+                        try:
+                            await context.route("**/*", _block_listing_resources)
+                            
+                            page = await context.new_page()
+                            
+                            journal_name = slug.replace('/', '_')
+                            journal_folder = os.path.join(out_folder, journal_name)
+                            os.makedirs(journal_folder, exist_ok=True)
+                            print(f"📂 Journal folder: {journal_folder}")
                             
-                            extract_time = time.time() - extract_start_time
+                            # Scan the folder once; files over 100 bytes count as already extracted
+                            with os.scandir(journal_folder) as entries:
+                                extracted_paths.update(
+                                    entry.path for entry in entries
+                                    if entry.is_file() and entry.stat().st_size > 100
+                                )
                             
-                            if success and os.path.exists(dest_path):
-                                file_size = os.path.getsize(dest_path)
-                                file_size_kb = file_size / 1024
+                            url = f"https://www.cell.com/{slug}/newarticles"
+                            print(f"🔎 Crawling journal: {slug} at {url}")
+                            
+                            if total_progress_callback:
+                                total_progress_callback(found_count, total_articles_found, f"Loading journal: {slug}", 0, 0, "loading")
+                            
+                            await _goto_listing(page, url, ".articleCitation")
+                            
+                            await handle_cookie_consent(page)
+                            
+                            html = await page.evaluate(_LISTING_HTML_JS, _CITATION_SELECTOR)
+                            soup = BeautifulSoup(html, "lxml", parse_only=_CITATION_STRAINER)
+                            articles = _ARTICLE_CITATION_SELECTOR.select(soup)
+                            
+                            if not articles:
+                                page_title = await page.title()
+                                print(f"⚠️ No articles found on {url}. Page title: {page_title}")
+                                return
+                            
+                            # One pass over the listing: count OA citations and keep those in the
+                            # requested year range together with their publish date
+                            oa_count = 0
+                            in_range = []
+                            for art in articles:
+                                if _OA_LABEL_SELECTOR.select_one(art) is None:
+                                    continue
+                                oa_count += 1
                                 
-                                if extract_time > 0:
-                                    speed_kbps = file_size_kb / extract_time
-                                else:
-                                    speed_kbps = 0
+                                year_tag = _ARTICLE_DATE_SELECTOR.select_one(art)
+                                year_text = year_tag.get_text().strip() if year_tag else ""
+                                year_str = year_text.rsplit(",", 1)[-1]
+                                year_match = _YEAR_RE.search(year_str)
+                                year = int(year_match.group()) if year_match else 0
                                 
-                                if cli_progress is None:
-                                    print(f"✅ Extracted {file_size_kb:.1f} KB in {extract_time:.1f}s ({speed_kbps:.1f} KB/s)", flush=True)
+                                if year_from <= year <= year_to:
+                                    in_range.append((art, year_text or "Unknown"))
+                            
+                            journal_download_count = 0
+                            journal_target = min(len(in_range), limit) if limit else len(in_range)
+                            print(f"📚 Found {oa_count} open access articles in {slug}, {len(in_range)} from {year_from}-{year_to} (will extract up to {journal_target})")
+                            add_articles_found(journal_target)
+                            
+                            # Collect the articles to extract first, then fan them out over the context pool
+                            candidates = []
+                            for art, publish_date in in_range:
+                                candidate = build_candidate(art, journal_folder, publish_date, 'open-access', len(candidates))
+                                if candidate:
+                                    candidates.append(candidate)
+                            
+                            journal_download_count = await extract_candidates(pool, candidates, journal_download_count)
+                            
+                            if limit and journal_download_count >= limit:
+                                print(f"✋ Reached limit of {limit} for journal {slug}", flush=True)
+                            
+                            # Crawl issue archives if requested —
+                            # Also fall back to crawling issue pages when the /newarticles run
+                            # produced no saved JSONs for this journal (journal_download_count == 0).
+                            # This ensures we don't stop early just because the newarticles page
+                            # didn't yield any extractable JSON.
+                            should_crawl_archives = crawl_archives or (journal_download_count == 0)
+                            if should_crawl_archives:
+                                print(f"\n📚 Crawling issue archives for journal: {slug}", flush=True)
+                                print(f"🔧 Opening archive page in the journal context...", flush=True)
                                 
-                                saved_files.append(dest_path)
-                                open_access_articles.append(article_title)
-                                article_metadata.append((dest_path, article_title, publish_date))
-                                found_count += 1
-                                journal_download_count += 1
+                                archive_page = await context.new_page()
                                 
-                                if progress_callback:
-                                    progress_callback(filename, dest_path)
+                                print(f"✅ Archive page ready", flush=True)
                                 
-                                if total_progress_callback:
-                                    total_progress_callback(found_count, found_count, f"Saved: {article_title[:50]}...", file_size, speed_kbps, "completed")
-                                elif cli_progress:
-                                    cli_progress.update(found_count, found_count, f"✅ {article_title[:30]}...", file_size, speed_kbps, "completed")
-                            else:
-                                logger.error(f"❌ Failed to save text file: {dest_path}")
-                        else:
-                            logger.error(f"❌ Extracted text is too small or empty")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ Failed to extract text for '{article_title[:50]}': {e}")
-                        logger.debug(traceback.format_exc())
-                    
-                    await asyncio.sleep(1)
-                
-                # Crawl issue archives if requested —
-                # Also fall back to crawling issue pages when the /newarticles run
-                # produced no saved JSONs for this journal (journal_download_count == 0).
-                # This ensures we don't stop early just because the newarticles page
-                # didn't yield any extractable JSON.
-                should_crawl_archives = crawl_archives or (journal_download_count == 0)
-                if should_crawl_archives:
-                    print(f"\n📚 Crawling issue archives for journal: {slug}", flush=True)
-                    print(f"🔧 Creating separate context for archive crawling...", flush=True)
-                    
-                    archive_context = await browser.new_context(
-                        accept_downloads=False,
-                        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:143.0) Gecko/20100101 Firefox/143.0',
-                        viewport={'width': 1920, 'height': 1080},
-                        locale='en-US',
-                        timezone_id='America/New_York',
-                        permissions=['geolocation'],
-                        geolocation={'longitude': -74.0060, 'latitude': 40.7128},
-                        color_scheme='light',
-                        extra_http_headers={
-                            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                            'Accept-Language': 'en-US,en;q=0.9',
-                            'Accept-Encoding': 'gzip, deflate, br',
-                            'Connection': 'keep-alive',
-                            'Upgrade-Insecure-Requests': '1',
-                        }
-                    )
-                    
-                    archive_page = await archive_context.new_page()
-                    await stealth.apply_stealth_async(archive_page)
-                    
-                    await archive_page.add_init_script("""
-                        Object.defineProperty(navigator, 'webdriver', {
-                            get: () => undefined
-                        });
-                    """)
-                    
-                    print(f"✅ Archive context ready", flush=True)
-                    
-                    issue_index_url = f"https://www.cell.com/{slug}/issues"
-                    print(f"Loading issue archive index: {issue_index_url}", flush=True)
-                    await archive_page.goto(issue_index_url, timeout=30000)
-                    await archive_page.wait_for_timeout(3000)
-                    
-                    await handle_cookie_consent(archive_page)
-                    
-                    # STEP 1: Expand outer accordion sections (year ranges like "2010-2019")
-                    # These are collapsed by default and contain volumes inside
-                    try:
-                        outer_accordions = archive_page.locator('a.accordion__control')
-                        accordion_count = await outer_accordions.count()
-                        print(f"🔧 Found {accordion_count} year range sections, expanding all...", flush=True)
-                        
-                        for i in range(accordion_count):
-                            try:
-                                accordion = outer_accordions.nth(i)
-                                # Check if it's expanded (aria-expanded="true")
-                                is_expanded = await accordion.get_attribute('aria-expanded')
-                                if is_expanded != 'true':
-                                    accordion_text = await accordion.text_content()
-                                    await accordion.click()
-                                    await archive_page.wait_for_timeout(800)
-                                    print(f"  ✅ Expanded section: {accordion_text.strip()}", flush=True)
-                            except Exception as e:
-                                logger.debug(f"Failed to expand accordion {i}: {e}")
-                        
-                        # Wait for all accordion content to load
-                        await archive_page.wait_for_timeout(1500)
-                    except Exception as e:
-                        print(f"⚠️ Failed to expand year range sections: {e}", flush=True)
-                    
-                    # STEP 2: Expand individual volume toggles for target years
-                    # These are <a> tags with class "list-of-issues__group-expand"
-                    volumes_to_expand = []
-                    try:
-                        volume_toggles = archive_page.locator('a.list-of-issues__group-expand')
-                        toggle_count = await volume_toggles.count()
-                        print(f"🔧 Found {toggle_count} volume toggles, identifying target volumes...", flush=True)
-                        
-                        # First pass: identify which volumes to expand
-                        for i in range(toggle_count):
-                            try:
-                                toggle = volume_toggles.nth(i)
-                                volume_text = await toggle.text_content()
-                                if volume_text:
-                                    year_match = re.search(r'\((\d{4})\)', volume_text)
-                                    if year_match:
-                                        vol_year = int(year_match.group(1))
-                                        if year_from <= vol_year <= year_to + 1:
-                                            volumes_to_expand.append((i, volume_text.strip()))
-                            except Exception as e:
-                                logger.debug(f"Failed to check volume toggle {i}: {e}")
-                        
-                        # Second pass: click all target volumes
-                        print(f"🔧 Expanding {len(volumes_to_expand)} volumes...", flush=True)
-                        for idx, vol_text in volumes_to_expand:
-                            try:
-                                toggle = volume_toggles.nth(idx)
-                                await toggle.click()
-                                print(f"  ✅ Clicked: {vol_text}", flush=True)
-                                await archive_page.wait_for_timeout(500)
-                            except Exception as e:
-                                logger.debug(f"Failed to click volume {vol_text}: {e}")
-                        
-                        # Wait for all AJAX content to load
-                        if volumes_to_expand:
-                            print(f"⏳ Waiting for issue lists to load...", flush=True)
-                            await archive_page.wait_for_timeout(3000)
-                            
-                            # Wait for issue links to appear in the DOM
-                            try:
-                                await archive_page.wait_for_selector('a[href*="/issue?pii="]', timeout=5000, state='attached')
-                            except:
-                                pass  # Continue even if selector doesn't appear
+                                issue_index_url = f"https://www.cell.com/{slug}/issues"
+                                print(f"Loading issue archive index: {issue_index_url}", flush=True)
+                                await _goto_listing(archive_page, issue_index_url, "a.accordion__control, a.list-of-issues__group-expand, a[href*='/issue?pii=']")
                                 
-                    except Exception as e:
-                        print(f"⚠️ Failed to expand volume toggles: {e}", flush=True)
-
-                    html = await archive_page.content()
-                    soup = BeautifulSoup(html, "html.parser")
-                    
-                    print(f"📂 Parsing issue links from page HTML...", flush=True)
-                    issue_links = []
-                    in_open_archive = False
-                    
-                    # Broaden selector to catch multiple issue URL patterns.
-                    # Some pages may use different href formats for older issues.
-                    all_issue_links = soup.select(
-                        'a[href*="/issue?pii="]'
-                    )
-                    print(f"🔍 Found {len(all_issue_links)} total issue links on page", flush=True)
-                    
-                    for link in all_issue_links:
-                        href = link.get("href", "")
-                        if not href:
-                            continue
-                        
-                        # Check if this is after the Open Archive marker
-                        parent_li = link.find_parent("li")
-                        if parent_li:
-                            open_archive_div = parent_li.find_previous("div", class_="list-of-issues__open-archive")
-                            if open_archive_div and not in_open_archive:
-                                in_open_archive = True
-                                print(f"📂 Entered Open Archive section", flush=True)
-                        
-                        # Try to extract date/year from the link or its parent <li> text.
-                        # Use a robust regex to find a 4-digit year (e.g., 2024).
-                        try:
-                            link_text = link.get_text(" ", strip=True)
-                            # Prefer the parent <li> text when available (it contains issue spans)
-                            parent_li = link.find_parent("li")
-                            if parent_li:
-                                block_text = parent_li.get_text(" ", strip=True)
-                            else:
-                                block_text = link_text
-
-                            # Normalize whitespace and collapse concatenated tokens
-                            block_text = re.sub(r"\s+", " ", block_text)
-
-                            year_match = re.search(r"\b(19|20)\d{2}\b", block_text)
-                            if year_match:
-                                issue_year = int(year_match.group(0))
-                                date_text = block_text
-                                if year_from <= issue_year <= year_to:
-                                    full_url = urljoin("https://www.cell.com", href)
-                                    if (full_url, in_open_archive, date_text) not in issue_links:
-                                        issue_links.append((full_url, in_open_archive, date_text))
-                                        logger.debug(f"✅ Found issue: {date_text[:50]} ({'Open Archive' if in_open_archive else 'Regular'})")
-                                else:
-                                    logger.debug(f"⏭️  Skipped issue (year {issue_year} not in range): {date_text[:50]}")
-                            else:
-                                logger.debug(f"⚠️  No year found in link text for: {href[:50]}")
-                        except Exception as e:
-                            logger.debug(f"⚠️  Failed to parse date from link {href[:50]} - {e}")
-                    
-                    print(f"📚 Found {len(issue_links)} issues to crawl for {slug} (filtered by year {year_from}-{year_to})", flush=True)
-                    
-                    for issue_url, is_open_archive, issue_date in issue_links:
-                        if limit and journal_download_count >= limit:
-                            print(f"✋ Reached journal limit of {limit}, stopping archive crawl", flush=True)
-                            break
-                        
-                        journal_download_count, should_stop = await crawl_issue_page(archive_page, issue_url, journal_folder, journal_download_count, is_open_archive, issue_date)
-                        if should_stop:
-                            break
-                        
-                        await asyncio.sleep(2)
-                    
-                    print(f"🔒 Closing archive context for journal: {slug}", flush=True)
-                    await archive_page.close()
-                    await archive_context.close()
+                                await handle_cookie_consent(archive_page)
+                                
+                                # STEP 1: Expand outer accordion sections (year ranges like "2010-2019")
+                                # These are collapsed by default and contain volumes inside
+                                try:
+                                    outer_accordions = archive_page.locator('a.accordion__control')
+                                    accordion_count = await outer_accordions.count()
+                                    print(f"🔧 Found {accordion_count} year range sections, expanding all...", flush=True)
+                                    
+                                    for i in range(accordion_count):
+                                        try:
+                                            accordion = outer_accordions.nth(i)
+                                            # Check if it's expanded (aria-expanded="true")
+                                            is_expanded = await accordion.get_attribute('aria-expanded')
+                                            if is_expanded != 'true':
+                                                accordion_text = await accordion.text_content()
+                                                await accordion.click()
+                                                print(f"  ✅ Expanded section: {accordion_text.strip()}", flush=True)
+                                        except Exception as e:
+                                            logger.debug(f"Failed to expand accordion {i}: {e}")
+                                    
+                                    # Wait until the expanded sections show their volume toggles
+                                    if accordion_count:
+                                        try:
+                                            await archive_page.wait_for_selector('a.list-of-issues__group-expand', timeout=3000, state='visible')
+                                        except Exception:
+                                            pass
+                                except Exception as e:
+                                    print(f"⚠️ Failed to expand year range sections: {e}", flush=True)
+                                
+                                # STEP 2: Expand individual volume toggles for target years
+                                # These are <a> tags with class "list-of-issues__group-expand"
+                                volumes_to_expand = []
+                                try:
+                                    volume_toggles = archive_page.locator('a.list-of-issues__group-expand')
+                                    toggle_count = await volume_toggles.count()
+                                    print(f"🔧 Found {toggle_count} volume toggles, identifying target volumes...", flush=True)
+                                    
+                                    # First pass: identify which volumes to expand
+                                    for i in range(toggle_count):
+                                        try:
+                                            toggle = volume_toggles.nth(i)
+                                            volume_text = await toggle.text_content()
+                                            if volume_text:
+                                                year_match = _VOLUME_YEAR_RE.search(volume_text)
+                                                if year_match:
+                                                    vol_year = int(year_match.group(1))
+                                                    if year_from <= vol_year <= year_to + 1:
+                                                        volumes_to_expand.append((i, volume_text.strip()))
+                                        except Exception as e:
+                                            logger.debug(f"Failed to check volume toggle {i}: {e}")
+                                    
+                                    # Second pass: click all target volumes
+                                    print(f"🔧 Expanding {len(volumes_to_expand)} volumes...", flush=True)
+                                    for idx, vol_text in volumes_to_expand:
+                                        try:
+                                            toggle = volume_toggles.nth(idx)
+                                            await toggle.click()
+                                            print(f"  ✅ Clicked: {vol_text}", flush=True)
+                                        except Exception as e:
+                                            logger.debug(f"Failed to click volume {vol_text}: {e}")
+                                    
+                                    # Wait for the issue-list requests fired by the toggles to finish
+                                    if volumes_to_expand:
+                                        print(f"⏳ Waiting for issue lists to load...", flush=True)
+                                        try:
+                                            await archive_page.wait_for_load_state("networkidle", timeout=5000)
+                                        except Exception:
+                                            pass
+                                        
+                                        # Wait for issue links to appear in the DOM
+                                        try:
+                                            await archive_page.wait_for_selector('a[href*="/issue?pii="]', timeout=5000, state='attached')
+                                        except:
+                                            pass  # Continue even if selector doesn't appear
+                                            
+                                except Exception as e:
+                                    print(f"⚠️ Failed to expand volume toggles: {e}", flush=True)
+
+                                html = await archive_page.evaluate(_LISTING_HTML_JS, _ISSUE_LIST_SELECTOR)
+                                soup = BeautifulSoup(html, "lxml")
+                                
+                                print(f"📂 Parsing issue links from page HTML...", flush=True)
+                                issue_links = []
+                                in_open_archive = False
+                                
+                                # Broaden selector to catch multiple issue URL patterns.
+                                # Some pages may use different href formats for older issues.
+                                all_issue_links = soup.find_all("a", href=_ISSUE_LINK_RE)
+                                print(f"🔍 Found {len(all_issue_links)} total issue links on page", flush=True)
+                                
+                                for link in all_issue_links:
+                                    href = link.get("href", "")
+                                    if not href:
+                                        continue
+                                    
+                                    # Check if this is after the Open Archive marker
+                                    parent_li = link.find_parent("li")
+                                    if parent_li:
+                                        open_archive_div = parent_li.find_previous("div", class_="list-of-issues__open-archive")
+                                        if open_archive_div and not in_open_archive:
+                                            in_open_archive = True
+                                            print(f"📂 Entered Open Archive section", flush=True)
+                                    
+                                    # Try to extract date/year from the link or its parent <li> text.
+                                    # Use a robust regex to find a 4-digit year (e.g., 2024).
+                                    try:
+                                        link_text = link.get_text(" ", strip=True)
+                                        # Prefer the parent <li> text when available (it contains issue spans)
+                                        parent_li = link.find_parent("li")
+                                        if parent_li:
+                                            block_text = parent_li.get_text(" ", strip=True)
+                                        else:
+                                            block_text = link_text
+
+                                        # Normalize whitespace and collapse concatenated tokens
+                                        block_text = _WS_RE.sub(" ", block_text)
+
+                                        year_match = _ISSUE_YEAR_RE.search(block_text)
+                                        if year_match:
+                                            issue_year = int(year_match.group(0))
+                                            date_text = block_text
+                                            if year_from <= issue_year <= year_to:
+                                                full_url = urljoin("https://www.cell.com", href)
+                                                if (full_url, in_open_archive, date_text) not in issue_links:
+                                                    issue_links.append((full_url, in_open_archive, date_text))
+                                                    logger.debug(f"✅ Found issue: {date_text[:50]} ({'Open Archive' if in_open_archive else 'Regular'})")
+                                            else:
+                                                logger.debug(f"⏭️  Skipped issue (year {issue_year} not in range): {date_text[:50]}")
+                                        else:
+                                            logger.debug(f"⚠️  No year found in link text for: {href[:50]}")
+                                    except Exception as e:
+                                        logger.debug(f"⚠️  Failed to parse date from link {href[:50]} - {e}")
+                                
+                                print(f"📚 Found {len(issue_links)} issues to crawl for {slug} (filtered by year {year_from}-{year_to})", flush=True)
+                                
+                                for issue_url, is_open_archive, issue_date in issue_links:
+                                    if limit and journal_download_count >= limit:
+                                        print(f"✋ Reached journal limit of {limit}, stopping archive crawl", flush=True)
+                                        break
+                                    
+                                    journal_download_count, should_stop = await crawl_issue_page(archive_page, issue_url, journal_folder, journal_download_count, pool, is_open_archive, issue_date)
+                                    if should_stop:
+                                        break
+                                    
+                                    await asyncio.sleep(2)
+                        finally:
+                            # Also runs when the journal fails, so its context is not left open
+                            # for the rest of the crawl
+                            print(f"🔒 Closing browser context for journal: {slug}", flush=True)
+                            for open_page in (archive_page, page):
+                                if open_page is not None and not open_page.is_closed():
+                                    await open_page.close()
+                            await context.close()
+                
+                results = await asyncio.gather(*(crawl_journal(slug) for slug in journal_slugs), return_exceptions=True)
+                for slug, result in zip(journal_slugs, results):
+                    if isinstance(result, BaseException):
+                        logger.error(f"❌ Failed to crawl journal {slug}: {result}")
+                        logger.debug("".join(traceback.format_exception(type(result), result, result.__traceback__)))
                 
-                print(f"🔒 Closing browser for journal: {slug}", flush=True)
-                await page.close()
-                await context.close()
+                print(f"🔒 Closing article extraction contexts", flush=True)
+                await close_context_pool(pool)
+                
+                print(f"🔒 Closing Firefox", flush=True)
                 await browser.close()
+    finally:
+        # Close the summary CSV even if the crawl fails, keeping the rows written so far
+        if csv_file is not None:
+            csv_file.close()
 
     if cli_progress:
         cli_progress.close()
     
     print(f"\n🎉 Extracted {found_count} JSON files to {out_folder}")
     
-    # Create CSV file with extraction summary
+    if csv_file is not None:
+        logger.info(f"✅ CSV summary saved to: {csv_path}")
+    
+    # Archive all journal subfolders into one file
     if saved_files:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        csv_filename = f"extraction_summary_{timestamp}.csv"
-        csv_path = os.path.join(out_folder, csv_filename)
+        # dict.fromkeys drops repeated members (e.g. from retried saves) and keeps order
+        json_members = list(dict.fromkeys(archive_members))
+        members = list(json_members)
+        if os.path.exists(csv_path):
+            members.append((csv_path, os.path.basename(csv_path)))
         
-        print(f"\n📄 Creating extraction summary CSV: {csv_filename}")
+        write_archive = _write_zip
+        use_zstd = archive_format == "tar.zst"
+        if use_zstd:
+            if ZSTD_AVAILABLE:
+                write_archive = _write_tar_zst
+            elif shutil.which("zstd"):
+                logger.info("📦 zstandard is not installed, compressing with the zstd command instead")
+                write_archive = _write_tar_zst_cli
+            else:
+                logger.warning("⚠️ Neither zstandard nor the zstd command is available, writing a ZIP archive instead")
+                use_zstd = False
         
-        try:
-            with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['Number', 'Journal', 'Article Name', 'Publish Date', 'File Path', 'File Size (KB)'])
-                
-                for idx, (file_path, article_name, publish_date) in enumerate(article_metadata, 1):
-                    journal_name = os.path.basename(os.path.dirname(file_path))
-                    file_size_kb = os.path.getsize(file_path) / 1024 if os.path.exists(file_path) else 0
-                    writer.writerow([idx, journal_name, article_name, publish_date, file_path, f"{file_size_kb:.2f}"])
-            
-            logger.info(f"✅ CSV summary saved to: {csv_path}")
-        except Exception as e:
-            logger.error(f"❌ Failed to create CSV summary: {e}")
-    
-    # Zip all journal subfolders into one archive
-    if saved_files:
-        print(f"\n📦 Creating ZIP archive with all extracted JSON files...")
+        print(f"\n📦 Creating {'tar.zst' if use_zstd else 'ZIP'} archive with all extracted JSON files...")
         
-        zip_filename = f"all_journals_json_{timestamp}.zip"
-        zip_path = os.path.join(out_folder, zip_filename)
+        archive_filename = f"all_journals_json_{timestamp}.{'tar.zst' if use_zstd else 'zip'}"
+        archive_path = os.path.join(out_folder, archive_filename)
         
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for file_path in saved_files:
-                    arcname = os.path.relpath(file_path, out_folder)
-                    zipf.write(file_path, arcname)
-                
-                if os.path.exists(csv_path):
-                    zipf.write(csv_path, os.path.basename(csv_path))
+            # Compression runs in a worker thread so other tasks on the loop keep running
+            await asyncio.to_thread(write_archive, archive_path, members)
             
-            zip_size_mb = os.path.getsize(zip_path) / (1024 * 1024)
-            logger.info(f"✅ Created ZIP archive: {zip_filename} ({zip_size_mb:.1f} MB)")
-            logger.info(f"📦 Archive contains {len(saved_files)} JSON files from {len(set(os.path.dirname(f) for f in saved_files))} journals")
+            archive_size_mb = os.path.getsize(archive_path) / (1024 * 1024)
+            logger.info(f"✅ Created archive: {archive_filename} ({archive_size_mb:.1f} MB)")
+            logger.info(f"📦 Archive contains {len(json_members)} JSON files from {len(saved_journals)} journals")
         except Exception as e:
-            logger.error(f"❌ Failed to create ZIP archive: {e}")
+            logger.error(f"❌ Failed to create archive: {e}")
     
     return saved_files, open_access_articles